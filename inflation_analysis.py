@@ -7,67 +7,101 @@ bezogen auf das Basisjahr 2020.
 MIT License - Copyright (c) 2025 Eckart Grünhagen
 """
 
+import math
+import os
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Standardauflösung der gespeicherten Diagramme, über PLOT_DPI anpassbar
+DEFAULT_PLOT_DPI = 120
+
+def get_plot_dpi():
+    """Liest die Diagrammauflösung aus der Umgebungsvariable PLOT_DPI."""
+    wert = os.environ.get('PLOT_DPI')
+    if wert is None:
+        return DEFAULT_PLOT_DPI
+    try:
+        dpi = int(wert)
+    except ValueError:
+        dpi = 0
+    if dpi <= 0:
+        print(f"Warnung: Ungültiger Wert für PLOT_DPI ({wert!r}), "
+              f"verwende {DEFAULT_PLOT_DPI} dpi.")
+        return DEFAULT_PLOT_DPI
+    return dpi
+
+def read_csv(path):
+    """Liest eine semikolongetrennte CSV-Datei mit bereinigten Spaltennamen."""
+    df = pd.read_csv(path, sep=';', skipinitialspace=True)
+    df.columns = [col.strip() for col in df.columns]  # Leerzeichen entfernen
+    
+    # Beträge und Raten bleiben float64, damit die abgeleiteten Indizes exakt
+    # bleiben; für die Jahreszahlen genügt int16
+    if 'jahr' in df.columns:
+        df['jahr'] = df['jahr'].astype('int16')
+    return df
+
+def write_csv(df, path):
+    """Schreibt einen DataFrame als semikolongetrennte CSV-Datei ohne Index."""
+    df.to_csv(path, index=False, sep=';')
+
 def load_data():
     """Lädt die CSV-Dateien mit den Umsatzdaten."""
     # Nominal-Umsätze laden
-    df_nominal = pd.read_csv('bio_umsatz_nominal.csv', sep=';', skipinitialspace=True)
-    df_nominal.columns = df_nominal.columns.str.strip()  # Leerzeichen entfernen
+    df_nominal = read_csv('bio_umsatz_nominal.csv')
     
     # Real-Umsätze laden
-    df_real = pd.read_csv('bio_umsatz_real.csv', sep=';', skipinitialspace=True)
-    df_real.columns = df_real.columns.str.strip()  # Leerzeichen entfernen
+    df_real = read_csv('bio_umsatz_real.csv')
     
-    # Daten zusammenführen
-    df = pd.merge(df_nominal, df_real, on='jahr')
+    # Daten zusammenführen, nach Jahr sortiert
+    df = pd.merge_ordered(df_nominal, df_real, on='jahr', how='inner')
     
     return df
 
 def load_destatis_inflation():
     """Lädt die Destatis-Inflationsdaten für Lebensmittel."""
-    df_destatis = pd.read_csv('destatis_inflation_lebensmittel.csv', sep=';', skipinitialspace=True)
-    df_destatis.columns = df_destatis.columns.str.strip()
+    df_destatis = read_csv('destatis_inflation_lebensmittel.csv')
+    df_destatis = df_destatis.sort_values('jahr').reset_index(drop=True)
     return df_destatis
 
 def calculate_real_umsatz_with_destatis(df_nominal, df_destatis, base_year=2020):
     """
     Berechnet Realumsätze basierend auf Destatis-Inflationsraten.
+    
+    Die Jahresraten werden ab dem Basisjahr verkettet, d.h. der Preisindex
+    des Basisjahres ist 1.0. Fehlt für ein Jahr die Destatis-Rate, erhalten
+    dieses und alle folgenden Jahre keinen Preisindex (NaN).
     """
-    # Basis-Nominalumsatz für 2020
-    base_nominal = df_nominal[df_nominal['jahr'] == base_year]['umsatz_nominal'].iloc[0]
-    
-    # DataFrame für Ergebnisse
-    result_df = df_nominal.copy()
-    result_df['umsatz_real_destatis'] = result_df['umsatz_nominal']
-    result_df['preisindex_destatis'] = 1.0
-    result_df['inflation_kumulativ_destatis'] = 0.0
-    
-    # 2020 als Basis
-    result_df.loc[result_df['jahr'] == base_year, 'umsatz_real_destatis'] = base_nominal
-    
-    # Für Jahre nach 2020: Realumsatz mit Destatis-Inflationsraten berechnen
-    preisindex = 1.0
-    for _, row in df_destatis.iterrows():
-        jahr = row['jahr']
-        inflation_rate = row['inflation_rate_jahr']
-        
-        # Preisindex kumulativ berechnen
-        preisindex *= (1 + inflation_rate)
-        
-        # Realumsatz berechnen: Nominal / Preisindex
-        nominal_umsatz = df_nominal[df_nominal['jahr'] == jahr]['umsatz_nominal'].iloc[0]
-        real_umsatz = nominal_umsatz / preisindex
-        
-        # In Ergebnis-DataFrame eintragen
-        mask = result_df['jahr'] == jahr
-        result_df.loc[mask, 'umsatz_real_destatis'] = real_umsatz
-        result_df.loc[mask, 'preisindex_destatis'] = preisindex
-        result_df.loc[mask, 'inflation_kumulativ_destatis'] = (preisindex - 1) * 100
+    # Preisindex kumulativ aus den Destatis-Jahresraten berechnen
+    raten = df_destatis.set_index('jahr')['inflation_rate_jahr']
+    
+    # Lücken als NaN auffüllen, damit die Verkettung dort abbricht
+    raten = raten.reindex(range(raten.index.min(), raten.index.max() + 1))
+    destatis_jahre = raten.index.to_numpy()
+    destatis_preisindex = np.add(raten.to_numpy(), 1.0)
+    basis_faktor = destatis_preisindex[destatis_jahre <= base_year].prod()
+    np.cumprod(destatis_preisindex, out=destatis_preisindex)  # Verkettung im selben Array
+    
+    # Auf das Basisjahr normieren: Raten bis einschließlich Basisjahr herausrechnen
+    destatis_preisindex /= basis_faktor
+    preisindex_by_year = pd.Series(destatis_preisindex, index=destatis_jahre)
     
-    return result_df
+    # Basisjahr auf Preisindex 1.0 festlegen
+    preisindex = np.where(df_nominal['jahr'].to_numpy() == base_year, 1.0,
+                          df_nominal['jahr'].map(preisindex_by_year).to_numpy())
+    
+    # Realumsatz berechnen: Nominal / Preisindex
+    umsatz_real = np.divide(df_nominal['umsatz_nominal'].to_numpy(), preisindex)
+    kumulativ = np.subtract(preisindex, 1.0)
+    kumulativ *= 100.0
+    
+    return df_nominal.assign(
+        umsatz_real_destatis=umsatz_real,
+        preisindex_destatis=preisindex,
+        inflation_kumulativ_destatis=kumulativ,
+    )
 
 def calculate_inflation_rates(df, base_year=2020):
     """
@@ -78,19 +112,30 @@ def calculate_inflation_rates(df, base_year=2020):
     Preisindex_t = (Nominal_t / Real_t) / (Nominal_base / Real_base)
     Inflationsrate_t = (Preisindex_t - 1) * 100
     """
+    nominal = df['umsatz_nominal'].to_numpy()
+    real = df['umsatz_real'].to_numpy()
+    
     # Basiswerte für 2020
-    base_row = df[df['jahr'] == base_year].iloc[0]
-    base_ratio = base_row['umsatz_nominal'] / base_row['umsatz_real']
+    base = np.flatnonzero(df['jahr'].to_numpy() == base_year)[0]
     
     # Preisindex für jedes Jahr berechnen
-    df['preis_ratio'] = df['umsatz_nominal'] / df['umsatz_real']
-    df['preisindex'] = df['preis_ratio'] / base_ratio
+    base_ratio = nominal[base] / real[base]
+    preisindex = nominal / real
+    preisindex /= base_ratio
     
     # Inflationsrate berechnen (bezogen auf Basisjahr)
-    df['inflation_kumulativ'] = (df['preisindex'] - 1) * 100
+    kumulativ = (preisindex - 1.0) * 100.0
     
     # Jährliche Inflationsrate berechnen
-    df['inflation_jaehrlich'] = df['preisindex'].pct_change() * 100
+    jaehrlich = np.empty_like(preisindex)
+    jaehrlich[0] = np.nan
+    aenderung = jaehrlich[1:]
+    np.divide(preisindex[1:], preisindex[:-1], out=aenderung)
+    aenderung -= 1.0
+    aenderung *= 100.0
+    
+    df[['preisindex', 'inflation_kumulativ', 'inflation_jaehrlich']] = \
+        np.column_stack([preisindex, kumulativ, jaehrlich])
     
     return df
 
@@ -103,9 +148,10 @@ def print_results(df):
     
     print("Rohdaten:")
     print("-" * 50)
-    for _, row in df.iterrows():
-        print(f"{int(row['jahr'])}: Nominal {row['umsatz_nominal']:6.2f} Mrd €, "
-              f"Real {row['umsatz_real']:6.2f} Mrd €")
+    rohdaten = df[['jahr', 'umsatz_nominal', 'umsatz_real']]
+    for jahr, nominal, real in rohdaten.itertuples(index=False, name=None):
+        print(f"{int(jahr)}: Nominal {nominal:6.2f} Mrd €, "
+              f"Real {real:6.2f} Mrd €")
     print()
     
     print("Berechnete Inflationsraten:")
@@ -114,13 +160,11 @@ def print_results(df):
     print(f"{'':^6} {'(Basis=1.0)':<12} {'(%)':<12} {'(%)':<12}")
     print("-" * 50)
     
-    for _, row in df.iterrows():
-        jahr = int(row['jahr'])
-        preisindex = row['preisindex']
-        kumulativ = row['inflation_kumulativ']
-        jaehrlich = row['inflation_jaehrlich']
+    raten = df[['jahr', 'preisindex', 'inflation_kumulativ', 'inflation_jaehrlich']]
+    for jahr, preisindex, kumulativ, jaehrlich in raten.itertuples(index=False, name=None):
+        jahr = int(jahr)
         
-        if np.isnan(jaehrlich):
+        if math.isnan(jaehrlich):
             jaehrlich_str = "Basis"
         else:
             jaehrlich_str = f"{jaehrlich:+6.2f}"
@@ -133,105 +177,109 @@ def print_results(df):
     print("- Kumulativ: Gesamte Preissteigerung seit 2020 in %")
     print("- Jährlich: Preissteigerung gegenüber dem Vorjahr in %")
 
-def create_visualization(df):
+def style_axis(ax, title, xlabel, ylabel, legend=True):
+    """Setzt Titel, Achsenbeschriftungen, Legende und Gitter eines Diagramms."""
+    ax.update({'title': title, 'xlabel': xlabel, 'ylabel': ylabel})
+    if legend:
+        ax.legend()
+    ax.grid(True, alpha=0.3)
+
+def create_visualization(df, dpi=DEFAULT_PLOT_DPI):
     """Erstellt Visualisierungen der Daten."""
+    jahre = df['jahr'].to_numpy()
+    nominal = df['umsatz_nominal'].to_numpy()
+    real = df['umsatz_real'].to_numpy()
+    preisindex = df['preisindex'].to_numpy()
+    kumulativ = df['inflation_kumulativ'].to_numpy()
+    jaehrlich = df['inflation_jaehrlich'].to_numpy()
+    
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
     
     # 1. Nominal vs Real Umsatz
-    ax1.plot(df['jahr'], df['umsatz_nominal'], 'b-o', label='Nominal', linewidth=2)
-    ax1.plot(df['jahr'], df['umsatz_real'], 'r-s', label='Real (Basis: 2020)', linewidth=2)
-    ax1.set_title('Bio-Umsatz nach Lakner: Nominal vs. Real')
-    ax1.set_xlabel('Jahr')
-    ax1.set_ylabel('Umsatz (Mrd €)')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
+    ax1.plot(jahre, nominal, 'b-o', label='Nominal', linewidth=2)
+    ax1.plot(jahre, real, 'r-s', label='Real (Basis: 2020)', linewidth=2)
+    style_axis(ax1, 'Bio-Umsatz nach Lakner: Nominal vs. Real', 'Jahr', 'Umsatz (Mrd €)')
     
     # 2. Preisindex
-    ax2.plot(df['jahr'], df['preisindex'], 'g-o', linewidth=2, markersize=8)
+    ax2.plot(jahre, preisindex, 'g-o', linewidth=2, markersize=8)
     ax2.axhline(y=1.0, color='k', linestyle='--', alpha=0.5, label='Basisjahr 2020')
-    ax2.set_title('Preisindex (Basis: 2020 = 1.0)')
-    ax2.set_xlabel('Jahr')
-    ax2.set_ylabel('Preisindex')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
+    style_axis(ax2, 'Preisindex (Basis: 2020 = 1.0)', 'Jahr', 'Preisindex')
     
     # 3. Kumulative Inflation
-    ax3.bar(df['jahr'], df['inflation_kumulativ'], color='orange', alpha=0.7)
+    ax3.bar(jahre, kumulativ, color='orange', alpha=0.7)
     ax3.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    ax3.set_title('Kumulative Inflation seit 2020')
-    ax3.set_xlabel('Jahr')
-    ax3.set_ylabel('Inflation (%)')
-    ax3.grid(True, alpha=0.3)
+    style_axis(ax3, 'Kumulative Inflation seit 2020', 'Jahr', 'Inflation (%)', legend=False)
     
     # 4. Jährliche Inflation
-    jahre_ohne_basis = df[df['jahr'] != 2020]['jahr']
-    inflation_ohne_basis = df[df['jahr'] != 2020]['inflation_jaehrlich']
+    ohne_basis = jahre != 2020
+    jahre_ohne_basis = jahre[ohne_basis]
+    inflation_ohne_basis = jaehrlich[ohne_basis]
     ax4.bar(jahre_ohne_basis, inflation_ohne_basis, color='red', alpha=0.7)
     ax4.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    ax4.set_title('Jährliche Inflationsrate')
-    ax4.set_xlabel('Jahr')
-    ax4.set_ylabel('Inflation (%)')
-    ax4.grid(True, alpha=0.3)
+    style_axis(ax4, 'Jährliche Inflationsrate', 'Jahr', 'Inflation (%)', legend=False)
     
     plt.tight_layout()
-    plt.savefig('bio_inflation_analysis.png', dpi=300, bbox_inches='tight')
+    plt.savefig('bio_inflation_analysis.png', dpi=dpi)
     plt.show()
 
-def create_destatis_comparison(df_combined, df_destatis):
+def create_destatis_comparison(df_combined, df_destatis, dpi=DEFAULT_PLOT_DPI):
     """Erstellt Vergleichsgrafik mit Destatis-Inflationsraten."""
+    jahre = df_combined['jahr'].to_numpy()
+    nominal = df_combined['umsatz_nominal'].to_numpy()
+    real_lakner = df_combined['umsatz_real'].to_numpy()
+    real_destatis = df_combined['umsatz_real_destatis'].to_numpy()
+    preisindex_lakner = df_combined['preisindex'].to_numpy()
+    preisindex_destatis = df_combined['preisindex_destatis'].to_numpy()
+    kumulativ_lakner = df_combined['inflation_kumulativ'].to_numpy()
+    kumulativ_destatis = df_combined['inflation_kumulativ_destatis'].to_numpy()
+    destatis_jahre = df_destatis['jahr'].to_numpy()
+    destatis_raten = df_destatis['inflation_rate_jahr'].to_numpy()
+    
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
     
     # 1. Vergleich der Realumsätze
-    ax1.plot(df_combined['jahr'], df_combined['umsatz_nominal'], 'b-o', 
+    ax1.plot(jahre, nominal, 'b-o', 
              label='Nominal', linewidth=2, markersize=6)
-    ax1.plot(df_combined['jahr'], df_combined['umsatz_real'], 'r-s', 
+    ax1.plot(jahre, real_lakner, 'r-s', 
              label='Real (Lakner)', linewidth=2, markersize=6)
-    ax1.plot(df_combined['jahr'], df_combined['umsatz_real_destatis'], 'g-^', 
+    ax1.plot(jahre, real_destatis, 'g-^', 
              label='Real (Destatis)', linewidth=2, markersize=6)
-    ax1.set_title('Vergleich: Nominal- und Realumsätze')
-    ax1.set_xlabel('Jahr')
-    ax1.set_ylabel('Umsatz (Mrd €)')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
+    style_axis(ax1, 'Vergleich: Nominal- und Realumsätze', 'Jahr', 'Umsatz (Mrd €)')
     
     # 2. Vergleich der Preisindizes
-    ax2.plot(df_combined['jahr'], df_combined['preisindex'], 'r-s', 
+    ax2.plot(jahre, preisindex_lakner, 'r-s', 
              label='Preisindex (Lakner)', linewidth=2, markersize=6)
-    ax2.plot(df_combined['jahr'], df_combined['preisindex_destatis'], 'g-^', 
+    ax2.plot(jahre, preisindex_destatis, 'g-^', 
              label='Preisindex (Destatis)', linewidth=2, markersize=6)
     ax2.axhline(y=1.0, color='k', linestyle='--', alpha=0.5, label='Basisjahr 2020')
-    ax2.set_title('Vergleich der Preisindizes (Basis: 2020 = 1.0)')
-    ax2.set_xlabel('Jahr')
-    ax2.set_ylabel('Preisindex')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
+    style_axis(ax2, 'Vergleich der Preisindizes (Basis: 2020 = 1.0)', 'Jahr', 'Preisindex')
     
     # 3. Jährliche Inflationsraten aus Destatis-Daten
-    ax3.bar(df_destatis['jahr'], df_destatis['inflation_rate_jahr'] * 100, 
+    ax3.bar(destatis_jahre, destatis_raten * 100, 
             color='green', alpha=0.7, label='Destatis Jahresraten')
     ax3.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    ax3.set_title('Destatis: Jährliche Inflationsraten Lebensmittel')
-    ax3.set_xlabel('Jahr')
-    ax3.set_ylabel('Inflation (%)')
-    ax3.legend()
-    ax3.grid(True, alpha=0.3)
+    style_axis(ax3, 'Destatis: Jährliche Inflationsraten Lebensmittel', 'Jahr', 'Inflation (%)')
     
     # 4. Kumulative Inflation im Vergleich
-    ax4.bar(df_combined['jahr'], df_combined['inflation_kumulativ'], 
-            color='red', alpha=0.7, width=0.4, label='Lakner (implizit)')
-    ax4.bar(df_combined['jahr'] + 0.4, df_combined['inflation_kumulativ_destatis'], 
-            color='green', alpha=0.7, width=0.4, label='Destatis')
+    breite = 0.4
+    ax4.bar(jahre, kumulativ_lakner, 
+            color='red', alpha=0.7, width=breite, label='Lakner (implizit)')
+    ax4.bar(jahre + breite, kumulativ_destatis, 
+            color='green', alpha=0.7, width=breite, label='Destatis')
     ax4.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    ax4.set_title('Vergleich: Kumulative Inflation seit 2020')
-    ax4.set_xlabel('Jahr')
-    ax4.set_ylabel('Inflation (%)')
-    ax4.legend()
-    ax4.grid(True, alpha=0.3)
+    style_axis(ax4, 'Vergleich: Kumulative Inflation seit 2020', 'Jahr', 'Inflation (%)')
     
     plt.tight_layout()
-    plt.savefig('bio_destatis_comparison.png', dpi=300, bbox_inches='tight')
+    plt.savefig('bio_destatis_comparison.png', dpi=dpi)
     plt.show()
 
+def format_wert(wert, format_spec):
+    """Formatiert eine Zahl; fehlende Werte (NaN) werden als 'k.A.' ausgegeben."""
+    text = format(wert, format_spec)
+    if math.isnan(wert):
+        return "k.A.".rjust(len(text))
+    return text
+
 def print_destatis_comparison(df_combined, df_destatis):
     """Gibt den Vergleich mit Destatis-Daten aus."""
     print("\n" + "=" * 80)
@@ -241,83 +289,101 @@ def print_destatis_comparison(df_combined, df_destatis):
     
     print("Destatis Lebensmittel-Inflationsraten (jährlich):")
     print("-" * 50)
-    for _, row in df_destatis.iterrows():
-        print(f"{int(row['jahr'])}: {row['inflation_rate_jahr']*100:+6.1f}%")
+    raten = df_destatis[['jahr', 'inflation_rate_jahr']]
+    for jahr, inflation_rate in raten.itertuples(index=False, name=None):
+        print(f"{int(jahr)}: {inflation_rate*100:+6.1f}%")
     
     print("\nVergleich der berechneten Realumsätze:")
     print("-" * 70)
     print(f"{'Jahr':<6} {'Nominal':<10} {'Real (Lakner)':<15} {'Real (Destatis)':<15} {'Differenz':<10}")
     print("-" * 70)
     
-    for _, row in df_combined.iterrows():
-        jahr = int(row['jahr'])
-        nominal = row['umsatz_nominal']
-        real_lakner = row['umsatz_real']
-        real_destatis = row['umsatz_real_destatis']
+    umsaetze = df_combined[['jahr', 'umsatz_nominal', 'umsatz_real', 'umsatz_real_destatis']]
+    for jahr, nominal, real_lakner, real_destatis in umsaetze.itertuples(index=False, name=None):
+        jahr = int(jahr)
         differenz = real_destatis - real_lakner
         
-        print(f"{jahr:<6} {nominal:8.2f}   {real_lakner:10.2f}      {real_destatis:10.2f}       {differenz:+7.2f}")
+        print(f"{jahr:<6} {nominal:8.2f}   {real_lakner:10.2f}      "
+              f"{format_wert(real_destatis, '10.2f')}       {format_wert(differenz, '+7.2f')}")
     
     print("\nVergleich der kumulativen Inflation seit 2020:")
     print("-" * 60)
     print(f"{'Jahr':<6} {'Lakner (%)':<12} {'Destatis (%)':<12} {'Differenz':<10}")
     print("-" * 60)
     
-    for _, row in df_combined.iterrows():
-        jahr = int(row['jahr'])
-        lakner_kumul = row['inflation_kumulativ']
-        destatis_kumul = row['inflation_kumulativ_destatis']
+    kumuliert = df_combined[['jahr', 'inflation_kumulativ', 'inflation_kumulativ_destatis']]
+    for jahr, lakner_kumul, destatis_kumul in kumuliert.itertuples(index=False, name=None):
+        jahr = int(jahr)
         diff_kumul = destatis_kumul - lakner_kumul
         
-        print(f"{jahr:<6} {lakner_kumul:8.2f}     {destatis_kumul:8.2f}       {diff_kumul:+7.2f}")
+        print(f"{jahr:<6} {lakner_kumul:8.2f}     "
+              f"{format_wert(destatis_kumul, '8.2f')}       {format_wert(diff_kumul, '+7.2f')}")
 
 def main():
     """Hauptfunktion."""
     try:
+        dpi = get_plot_dpi()
+        
         # Ursprüngliche Daten laden und analysieren
         df = load_data()
         df = calculate_inflation_rates(df, base_year=2020)
         print_results(df)
-        create_visualization(df)
-        
-        # Destatis-Daten laden
-        df_destatis = load_destatis_inflation()
-        
-        # Nominal-Umsätze mit Destatis-Inflationsraten verarbeiten
-        df_nominal = df[['jahr', 'umsatz_nominal']].copy()
-        df_combined = calculate_real_umsatz_with_destatis(df_nominal, df_destatis)
-        
-        # Lakner-Daten zu Combined-DataFrame hinzufügen
-        df_combined = pd.merge(df_combined, df[['jahr', 'umsatz_real', 'preisindex', 'inflation_kumulativ']], 
-                              on='jahr', how='left')
-        
-        # Vergleichsanalyse ausgeben
-        print_destatis_comparison(df_combined, df_destatis)
-        
-        # Neue Vergleichsgrafik erstellen
-        create_destatis_comparison(df_combined, df_destatis)
-        
-        # Zusätzliche Analyse
-        print("\nZusätzliche Erkenntnisse:")
-        print("-" * 30)
-        
-        inflation_2025_lakner = df[df['jahr'] == 2025]['inflation_kumulativ'].iloc[0]
-        inflation_2025_destatis = df_combined[df_combined['jahr'] == 2025]['inflation_kumulativ_destatis'].iloc[0]
-        print(f"• Gesamte Inflation 2020-2025 (Lakner): {inflation_2025_lakner:+.2f}%")
-        print(f"• Gesamte Inflation 2020-2025 (Destatis): {inflation_2025_destatis:+.2f}%")
-        print(f"• Differenz: {inflation_2025_destatis - inflation_2025_lakner:+.2f} Prozentpunkte")
-        
-        avg_destatis = df_destatis['inflation_rate_jahr'].mean() * 100
-        print(f"• Durchschnittliche jährliche Inflation (Destatis): {avg_destatis:+.2f}%")
-        
-        # Ergebnisse speichern
-        df.to_csv('bio_inflation_results.csv', index=False, sep=';')
-        df_combined.to_csv('bio_destatis_comparison.csv', index=False, sep=';')
+        create_visualization(df, dpi=dpi)
         
+        # Lakner-Ergebnisse speichern
+        write_csv(df, 'bio_inflation_results.csv')
         print(f"\n✓ Lakner-Analyse gespeichert in 'bio_inflation_results.csv'")
-        print(f"✓ Vergleichsanalyse gespeichert in 'bio_destatis_comparison.csv'")
         print(f"✓ Lakner-Diagramm gespeichert als 'bio_inflation_analysis.png'")
-        print(f"✓ Vergleichsdiagramm gespeichert als 'bio_destatis_comparison.png'")
+        
+        # Destatis-Daten laden; ohne sie wird nur die Lakner-Analyse erstellt
+        try:
+            df_destatis = load_destatis_inflation()
+        except FileNotFoundError as e:
+            print(f"\nHinweis: Destatis-Daten nicht gefunden - {e}")
+            df_destatis = None
+        else:
+            if df_destatis.empty:
+                print("\nHinweis: Destatis-Daten sind leer")
+                df_destatis = None
+        
+        if df_destatis is None:
+            print("Der Vergleich mit Destatis wird übersprungen.")
+        else:
+            # Nominal-Umsätze mit Destatis-Inflationsraten verarbeiten
+            df_nominal = df[['jahr', 'umsatz_nominal']]
+            df_combined = calculate_real_umsatz_with_destatis(df_nominal, df_destatis)
+            
+            # Lakner-Daten zu Combined-DataFrame hinzufügen (gleiche Zeilenreihenfolge wie df)
+            if not np.array_equal(df_combined['jahr'].to_numpy(), df['jahr'].to_numpy()):
+                raise ValueError("Jahre von Lakner- und Destatis-Tabelle stimmen nicht überein")
+            for col in ('umsatz_real', 'preisindex', 'inflation_kumulativ'):
+                df_combined[col] = df[col].to_numpy()
+            
+            # Vergleichsanalyse ausgeben
+            print_destatis_comparison(df_combined, df_destatis)
+            
+            # Neue Vergleichsgrafik erstellen
+            create_destatis_comparison(df_combined, df_destatis, dpi=dpi)
+            
+            # Zusätzliche Analyse
+            print("\nZusätzliche Erkenntnisse:")
+            print("-" * 30)
+            
+            df_by_year = df.set_index('jahr', drop=False)
+            df_combined_by_year = df_combined.set_index('jahr', drop=False)
+            inflation_2025_lakner = df_by_year.at[2025, 'inflation_kumulativ']
+            inflation_2025_destatis = df_combined_by_year.at[2025, 'inflation_kumulativ_destatis']
+            print(f"• Gesamte Inflation 2020-2025 (Lakner): {inflation_2025_lakner:+.2f}%")
+            print(f"• Gesamte Inflation 2020-2025 (Destatis): {format_wert(inflation_2025_destatis, '+.2f')}%")
+            print(f"• Differenz: {format_wert(inflation_2025_destatis - inflation_2025_lakner, '+.2f')} Prozentpunkte")
+            
+            avg_destatis = df_destatis['inflation_rate_jahr'].mean() * 100
+            print(f"• Durchschnittliche jährliche Inflation (Destatis): {avg_destatis:+.2f}%")
+            
+            # Vergleichsergebnisse speichern
+            write_csv(df_combined, 'bio_destatis_comparison.csv')
+            print(f"\n✓ Vergleichsanalyse gespeichert in 'bio_destatis_comparison.csv'")
+            print(f"✓ Vergleichsdiagramm gespeichert als 'bio_destatis_comparison.png'")
         
     except FileNotFoundError as e:
         print(f"Fehler: Datei nicht gefunden - {e}")